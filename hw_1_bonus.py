@@ -2,9 +2,12 @@
 import argparse
 import hashlib
 import struct
-import csv
+import mmap
 import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 # ANSI escape codes for colors and formatting
 RESET = '\033[0m'
@@ -18,120 +21,184 @@ BLUE = '\033[34m'
 MAGENTA = '\033[35m'
 CYAN = '\033[36m'
 WHITE = '\033[37m'
+# Pre-built colored labels used in verbose partition listings
+BOOTABLE_LABEL = f"{GREEN}Bootable{RESET}"
+NON_BOOTABLE_LABEL = f"{RED}Non-bootable{RESET}"
+
+# Chunk size used when feeding the mapped image to the hashers
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+# Hash labels used in output file names, mapped to their hashlib algorithm names
+HASH_ALGORITHMS = (
+    ("MD5", "md5"),
+    ("SHA-256", "sha256"),
+    ("SHA-512", "sha512"),
+)
+
+# Precompiled layouts for the on-disk structures
+GPT_HEADER = struct.Struct('<8sIIIIQQQQ16sQIII')  # 92 bytes at LBA 1
+GPT_ENTRY = struct.Struct('<16s16sQQQ72s')  # type GUID, unique GUID, first/last LBA, attributes, name
+GUID = struct.Struct('<IHH8s')  # mixed-endian GUID fields
+ZERO_GUID = bytes(16)  # type GUID of an unused GPT entry
+# Maps every byte to itself if printable ASCII, otherwise to '.'
+PRINTABLE_ASCII = bytes(c if 32 <= c <= 126 else ord('.') for c in range(256))
+MBR_ENTRY = struct.Struct('<B3sB3sII')  # boot flag, CHS start, type, CHS end, start LBA, sectors
+MBR_TABLE_OFFSET = 446
+
+# Size units, largest first, shown once the size reaches one whole unit
+SIZE_UNITS = (
+    (1 << 30, "GB"),
+    (1 << 20, "MB"),
+)
 
 # Function to format size into GB, MB, or KB
 def format_size(bytes_size):
-    if bytes_size >= 1024 ** 3:  # 1 GB
-        size_gb = bytes_size / (1024 ** 3)
-        return f"{size_gb:.2f} GB"
-    elif bytes_size >= 1024 ** 2:  # 1 MB
-        size_mb = bytes_size / (1024 ** 2)
-        return f"{size_mb:.2f} MB"
-    else:
-        size_kb = bytes_size / 1024
-        return f"{size_kb:.2f} KB"
+    for unit_size, unit in SIZE_UNITS:
+        if bytes_size >= unit_size:
+            return f"{bytes_size / unit_size:.2f} {unit}"
+    return f"{bytes_size / 1024:.2f} KB"
 
 # Loads partition type mappings from the CSV file.
+# MBR type codes are a single byte, so the result is a 256-entry list indexed by code.
 def load_partition_types(csv_file='PartitionTypes.csv'):
-    partition_types = {}
+    partition_types = ["Unknown"] * 256
+    # The file is plain "code,name" lines with no quoting, so a split is enough
     with open(csv_file, 'r') as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if row and len(row) >= 2:
+        for line in f:
+            row = line.rstrip('\n').split(',', 1)
+            if len(row) >= 2:
                 code = row[0].strip().lower()  # Always lowercase for consistency
                 name = row[1].strip()
                 try:
                     hex_value = int(code, 16)  # Convert code to integer
-                    partition_types[hex_value] = name
                 except ValueError:
                     print(f"Skipping invalid entry: {row}")
+                    continue
+                if not 0x00 <= hex_value <= 0xFF:  # Codes must fit in the single type byte
+                    print(f"Skipping invalid entry: {row}")
+                    continue
+                partition_types[hex_value] = name
     return partition_types
 
-# Calculates and saves hashes for the given file.
-def calculate_hashes(file_path, verbose=False):
+# Maps the whole image read-only so every stage reads straight from the page cache.
+# Yields an mmap, or the image read into bytes when it is empty or cannot be mapped.
+@contextmanager
+def map_image(file_path):
+    with open(file_path, 'rb') as f:
+        # Seeking to the end also gives the size of block devices, where st_size is 0
+        file_size = f.seek(0, os.SEEK_END)
+        if not file_size:
+            yield b''
+            return
+        if hasattr(os, 'posix_fadvise'):
+            # Ask the kernel for aggressive readahead over the whole file
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        try:
+            mm = mmap.mmap(f.fileno(), file_size, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mm = None  # e.g. a filesystem without mmap support
+        if mm is None:
+            # Fall back to a plain read; yielding outside the except block keeps errors
+            # raised by the caller from being chained onto the mmap failure
+            f.seek(0)
+            yield f.read()
+            return
+        with mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+
+# Calculates and saves hashes for the given image.
+def calculate_hashes(image, file_path, verbose=False):
     if verbose:
         print(f"{BOLD}{UNDERLINE}Calculating hashes for {file_path}:{RESET}")
-        file_size = os.path.getsize(file_path)
+        file_size = len(image)
         formatted_size = format_size(file_size)
         print(f"File size: {formatted_size} ({file_size} bytes)")
     start_time = time.time()
-    with open(file_path, 'rb') as f:
-        data = f.read()
-    save_hash(hashlib.md5(data).hexdigest(), file_path, "MD5", verbose=verbose)
-    save_hash(hashlib.sha256(data).hexdigest(), file_path, "SHA-256", verbose=verbose)
-    save_hash(hashlib.sha512(data).hexdigest(), file_path, "SHA-512", verbose=verbose)
+    hashers = [hashlib.new(name) for _, name in HASH_ALGORITHMS]
+    # Hash straight out of the mapping (no copy into Python).
+    # hashlib releases the GIL on large buffers, so each hasher gets its own thread.
+    with ThreadPoolExecutor(max_workers=len(hashers)) as executor, memoryview(image) as view:
+        for pos in range(0, len(view), HASH_CHUNK_SIZE):
+            with view[pos:pos + HASH_CHUNK_SIZE] as chunk:
+                list(executor.map(lambda h: h.update(chunk), hashers))
+    # Write all digests once hashing is finished
+    base_name = os.path.basename(file_path)
+    for (hash_type, _), h in zip(HASH_ALGORITHMS, hashers):
+        save_hash(h.hexdigest(), base_name, hash_type, verbose=verbose)
     end_time = time.time()
     if verbose:
         print(f"Hash calculation completed in {end_time - start_time:.2f} seconds.\n")
 
-# Saves the computed hash to a text file.
-def save_hash(hash_value, file_path, hash_type, verbose=False):
-    file_name = f"{hash_type}-{os.path.basename(file_path)}.txt"
+# Saves the computed hash to a text file named after the image's base name.
+def save_hash(hash_value, base_name, hash_type, verbose=False):
+    file_name = f"{hash_type}-{base_name}.txt"
     with open(file_name, 'w') as f:
         f.write(hash_value)
     if verbose:
         print(f"{GREEN}{hash_type} hash saved to {file_name}{RESET}")
 
 # Detects the partition scheme (MBR or GPT).
-def detect_partition_scheme(file_path, verbose=False):
+# Returns the scheme together with the sector it was detected from (the MBR, or the
+# GPT header) so the readers below don't have to fetch it again.
+def detect_partition_scheme(image, file_path, verbose=False):
     if verbose:
         print(f"{BOLD}{UNDERLINE}Detecting partition scheme for {file_path}:{RESET}")
-    with open(file_path, 'rb') as f:
-        mbr = f.read(512)
-        if verbose:
-            print(f"Read first 512 bytes (MBR): {len(mbr)} bytes")
-        if mbr[510:512] != b'\x55\xAA':
-            print(f"{RED}Invalid MBR signature. Cannot determine partition scheme.{RESET}")
-            return None
-        partition_entry = mbr[446:446+16]
-        part_type = partition_entry[4]
+    mbr = image[0:512]
+    if verbose:
+        print(f"Read first 512 bytes (MBR): {len(mbr)} bytes")
+    if mbr[510:512] != b'\x55\xAA':
+        print(f"{RED}Invalid MBR signature. Cannot determine partition scheme.{RESET}")
+        return None, None
+    part_type = mbr[MBR_TABLE_OFFSET + 4]
+    if verbose:
+        print(f"First partition type code: 0x{part_type:02X}")
+    if part_type == 0xEE:
         if verbose:
-            print(f"First partition type code: 0x{part_type:02X}")
-        if part_type == 0xEE:
+            print("Possible GPT protective MBR detected.")
+        header = image[512:512 + GPT_HEADER.size]  # GPT Header starts at LBA 1
+        if header[0:8] == b'EFI PART':
             if verbose:
-                print("Possible GPT protective MBR detected.")
-            f.seek(512)
-            header = f.read(8)
-            if header[0:8] == b'EFI PART':
-                if verbose:
-                    print(f"{GREEN}GPT header signature found.{RESET}")
-                return 'GPT'
-            else:
-                print(f"{RED}Invalid GPT header signature.{RESET}")
-                return None
+                print(f"{GREEN}GPT header signature found.{RESET}")
+            return 'GPT', header
         else:
-            if verbose:
-                print(f"{GREEN}MBR partition scheme detected.{RESET}")
-            return 'MBR'
+            print(f"{RED}Invalid GPT header signature.{RESET}")
+            return None, None
+    else:
+        if verbose:
+            print(f"{GREEN}MBR partition scheme detected.{RESET}")
+        return 'MBR', mbr
 
 # Formats a GUID to match little-endian formatting.
 def format_guid(guid_bytes):
-    # Split the GUID into parts
-    part1 = guid_bytes[0:4][::-1]
-    part2 = guid_bytes[4:6][::-1]
-    part3 = guid_bytes[6:8][::-1]
-    part4 = guid_bytes[8:10]
-    part5 = guid_bytes[10:16]
-    # Combine the parts
-    guid = part1 + part2 + part3 + part4 + part5
-    return guid.hex().upper()
+    # The first three fields are little-endian, the last 8 bytes are stored as-is
+    part1, part2, part3, rest = GUID.unpack_from(guid_bytes)
+    return f"{part1:08X}{part2:04X}{part3:04X}{rest.hex().upper()}"
+
+# Decodes a NUL-terminated UTF-16LE GPT partition name.
+def decode_partition_name(name_bytes):
+    # Cut at the first NUL code unit (an even offset) so only the used prefix is decoded
+    end = name_bytes.find(b'\x00\x00')
+    while end != -1 and end % 2:
+        end = name_bytes.find(b'\x00\x00', end + 1)
+    if end != -1:
+        name_bytes = name_bytes[:end]
+    return name_bytes.decode('utf-16le', errors='ignore').strip()
 
 # Reads and displays GPT partition entries from the raw disk image.
 # This function was updated with assistance from ChatGPT, an AI tool developed by OpenAI.
 # Reference: OpenAI. (2024). ChatGPT [Large language model]. openai.com/chatgpt
-def read_gpt(file_path, verbose=False):
+def read_gpt(image, file_path, header, verbose=False):
     sector_size = 512  # Default sector size
     if verbose:
         print(f"{BOLD}{UNDERLINE}Reading GPT from {file_path}:{RESET}")
-    with open(file_path, 'rb') as f:
-        f.seek(sector_size)  # GPT Header starts at LBA 1
-        header = f.read(92)
 
-    if len(header) < 92:
+    if len(header) < GPT_HEADER.size:
         print(f"{RED}GPT header is incomplete or file is too small.{RESET}")
         return
 
-    header_fields = struct.unpack('<8sIIIIQQQQ16sQIII', header)
+    header_fields = GPT_HEADER.unpack(header)
     signature = header_fields[0]
     if signature != b'EFI PART':
         print(f"{RED}Invalid GPT header signature.{RESET}")
@@ -140,93 +207,105 @@ def read_gpt(file_path, verbose=False):
     partition_entry_lba = header_fields[10]
     num_partition_entries = header_fields[11]
     size_of_partition_entry = header_fields[12]
+    if size_of_partition_entry == 0:
+        print(f"{RED}Invalid GPT partition entry size: 0 bytes.{RESET}")
+        return
 
     if verbose:
         print(f"Partition entries start at LBA {partition_entry_lba}")
         print(f"Number of partition entries: {num_partition_entries}")
         print(f"Size of each partition entry: {size_of_partition_entry} bytes")
 
+    # The partition entry array is contiguous, so read it in one go
+    table_start = partition_entry_lba * sector_size
+    table = image[table_start:table_start + num_partition_entries * size_of_partition_entry]
+
     partitions = []
-    with open(file_path, 'rb') as f:
-        for i in range(num_partition_entries):
-            f.seek((partition_entry_lba * sector_size) + i * size_of_partition_entry)
-            entry = f.read(size_of_partition_entry)
-            if len(entry) < size_of_partition_entry:
-                break
-
-            partition_type_guid_bytes = entry[0:16]
-            start_lba = struct.unpack('<Q', entry[32:40])[0]
-            end_lba = struct.unpack('<Q', entry[40:48])[0]
-            attributes = struct.unpack('<Q', entry[48:56])[0]
-
-            # Check if the partition entry is unused (all zeros)
-            if partition_type_guid_bytes == b'\x00' * 16:
-                continue  # Skip unused entries
-
-            partition_type_guid = format_guid(partition_type_guid_bytes)
-            unique_partition_guid = format_guid(entry[16:32])
-            name = entry[56:128].decode('utf-16le', errors='ignore').rstrip('\x00').strip()
-
-            partition_size_sectors = end_lba - start_lba + 1
-            partition_size_bytes = partition_size_sectors * sector_size
-            formatted_size = format_size(partition_size_bytes)
-
-            partitions.append({
-                'number': len(partitions) + 1,
-                'part_type_guid': partition_type_guid,
-                'unique_guid': unique_partition_guid,
-                'start_lba_hex': f"0x{start_lba:X}",
-                'end_lba_hex': f"0x{end_lba:X}",
-                'start_lba_dec': start_lba,
-                'end_lba_dec': end_lba,
-                'attributes': attributes,
-                'name': name,
-                'formatted_size': formatted_size
-            })
+    # Only whole entries are parsed if the table is truncated
+    entry_count = len(table) // size_of_partition_entry
+    if size_of_partition_entry == GPT_ENTRY.size:
+        # Standard 128-byte entries: decode the whole array in C
+        entries = GPT_ENTRY.iter_unpack(memoryview(table)[:entry_count * GPT_ENTRY.size])
+    else:
+        # Keep each entry within its own bounds; shorter entries are zero-padded
+        entries = (
+            GPT_ENTRY.unpack(
+                table[i * size_of_partition_entry:(i + 1) * size_of_partition_entry][:GPT_ENTRY.size]
+                .ljust(GPT_ENTRY.size, b'\0'))
+            for i in range(entry_count)
+        )
+    for (partition_type_guid_bytes, unique_guid_bytes, start_lba, end_lba,
+         attributes, name_bytes) in entries:
+
+        # Check if the partition entry is unused (all zeros)
+        if partition_type_guid_bytes == ZERO_GUID:
+            continue  # Skip unused entries
+
+        partition_type_guid = format_guid(partition_type_guid_bytes)
+        unique_partition_guid = format_guid(unique_guid_bytes)
+        name = decode_partition_name(name_bytes)
+
+        partition_size_sectors = end_lba - start_lba + 1
+        partition_size_bytes = partition_size_sectors * sector_size
+        formatted_size = format_size(partition_size_bytes)
 
-            if verbose:
-                print(f"\n{BOLD}Partition {len(partitions)}:{RESET}")
-                print(f"  Partition Type GUID: {CYAN}{partition_type_guid}{RESET}")
-                print(f"  Unique Partition GUID: {CYAN}{unique_partition_guid}{RESET}")
-                print(f"  Start LBA: {start_lba} ({start_lba * sector_size} bytes)")
-                print(f"  End LBA: {end_lba} ({end_lba * sector_size} bytes)")
-                print(f"  Attributes Flags: 0x{attributes:X}")
-                print(f"  Partition Size: {formatted_size}")
-                print(f"  Partition Name: {name}")
+        partitions.append({
+            'number': len(partitions) + 1,
+            'part_type_guid': partition_type_guid,
+            'unique_guid': unique_partition_guid,
+            'start_lba_hex': f"0x{start_lba:X}",
+            'end_lba_hex': f"0x{end_lba:X}",
+            'start_lba_dec': start_lba,
+            'end_lba_dec': end_lba,
+            'attributes': attributes,
+            'name': name,
+            'formatted_size': formatted_size
+        })
+
+        if verbose:
+            # One write per partition block rather than one per line
+            sys.stdout.write(f"\n{BOLD}Partition {len(partitions)}:{RESET}\n"
+                             f"  Partition Type GUID: {CYAN}{partition_type_guid}{RESET}\n"
+                             f"  Unique Partition GUID: {CYAN}{unique_partition_guid}{RESET}\n"
+                             f"  Start LBA: {start_lba} ({start_lba * sector_size} bytes)\n"
+                             f"  End LBA: {end_lba} ({end_lba * sector_size} bytes)\n"
+                             f"  Attributes Flags: 0x{attributes:X}\n"
+                             f"  Partition Size: {formatted_size}\n"
+                             f"  Partition Name: {name}\n")
 
     if partitions:
-        for p in partitions:
-            print(f"\nPartition number: {p['number']}")
-            print(f"Partition Type GUID : {p['part_type_guid']}")
-            print(f"Starting LBA in hex: {p['start_lba_hex']}")
-            print(f"Ending LBA in hex: {p['end_lba_hex']}")
-            print(f"Starting LBA in Decimal: {p['start_lba_dec']}")
-            print(f"Ending LBA in Decimal: {p['end_lba_dec']}")
-            print(f"Partition name: {p['name']}")
+        # Build the whole report first and emit it with a single write
+        sys.stdout.write("".join(
+            f"\nPartition number: {p['number']}\n"
+            f"Partition Type GUID : {p['part_type_guid']}\n"
+            f"Starting LBA in hex: {p['start_lba_hex']}\n"
+            f"Ending LBA in hex: {p['end_lba_hex']}\n"
+            f"Starting LBA in Decimal: {p['start_lba_dec']}\n"
+            f"Ending LBA in Decimal: {p['end_lba_dec']}\n"
+            f"Partition name: {p['name']}\n"
+            for p in partitions
+        ))
     else:
         print(f"{RED}No valid partitions found.{RESET}")
 
 # Reads and displays MBR partition entries from the raw disk image.
-def read_mbr(file_path, offsets, partition_types, verbose=False):
+def read_mbr(image, file_path, mbr, offsets, partition_types, verbose=False):
     sector_size = 512  # Default sector size
     if verbose:
         print(f"{BOLD}{UNDERLINE}Reading MBR from {file_path}:{RESET}")
         print(f"Sector size assumed: {sector_size} bytes")
-    with open(file_path, 'rb') as f:
-        mbr = f.read(sector_size)
 
     if mbr[510:512] != b'\x55\xAA':
         print(f"{RED}Invalid MBR signature.{RESET}")
         return
 
     partitions = []
-    for i in range(4):
-        entry_offset = 446 + i * 16
-        entry = mbr[entry_offset: entry_offset + 16]
+    # The four 16-byte entries sit back to back at offset 446; decode them in one call
+    table = memoryview(mbr)[MBR_TABLE_OFFSET:MBR_TABLE_OFFSET + 4 * MBR_ENTRY.size]
+    for i, (boot_flag, _, part_type, _, start_lba, size_in_sectors) in enumerate(MBR_ENTRY.iter_unpack(table)):
         if verbose:
+            entry = table[i * MBR_ENTRY.size:(i + 1) * MBR_ENTRY.size]
             print(f"\n{BOLD}Partition Entry {i + 1} raw data:{RESET} {entry.hex().upper()}")
-        boot_flag = entry[0]
-        part_type = int(entry[4])
 
         # Skip if partition type is 0x00
         if part_type == 0x00:
@@ -234,12 +313,10 @@ def read_mbr(file_path, offsets, partition_types, verbose=False):
                 print(f"{YELLOW}Partition {i + 1} is unused.{RESET}")
             continue  # Skip unused partition entries
 
-        start_lba = struct.unpack('<I', entry[8:12])[0]
-        size_in_sectors = struct.unpack('<I', entry[12:16])[0]
         size_in_bytes = size_in_sectors * sector_size
         formatted_size = format_size(size_in_bytes)
 
-        type_name = partition_types.get(part_type, "Unknown")
+        type_name = partition_types[part_type]
 
         partitions.append({
             'number': i + 1,
@@ -252,43 +329,43 @@ def read_mbr(file_path, offsets, partition_types, verbose=False):
         })
 
         if verbose:
-            boot_status = f"{GREEN}Bootable{RESET}" if boot_flag == 0x80 else f"{RED}Non-bootable{RESET}"
-            print(f"{BOLD}Partition {i + 1}:{RESET}")
-            print(f"  Boot Flag: 0x{boot_flag:02X} ({boot_status})")
-            print(f"  Partition Type: 0x{part_type:02X} ({type_name})")
-            print(f"  Start LBA: {start_lba} ({start_lba * sector_size} bytes)")
-            print(f"  Size in sectors: {size_in_sectors}")
-            print(f"  Partition Size: {formatted_size}")
-
-    for p in partitions:
-        print(f"({p['part_type']:02X}), {p['type_name']} , {p['start_lba']}, {p['size_in_sectors']}")
+            boot_status = BOOTABLE_LABEL if boot_flag == 0x80 else NON_BOOTABLE_LABEL
+            sys.stdout.write(f"{BOLD}Partition {i + 1}:{RESET}\n"
+                             f"  Boot Flag: 0x{boot_flag:02X} ({boot_status})\n"
+                             f"  Partition Type: 0x{part_type:02X} ({type_name})\n"
+                             f"  Start LBA: {start_lba} ({start_lba * sector_size} bytes)\n"
+                             f"  Size in sectors: {size_in_sectors}\n"
+                             f"  Partition Size: {formatted_size}\n")
+
+    sys.stdout.write("".join(
+        f"({p['part_type']:02X}), {p['type_name']} , {p['start_lba']}, {p['size_in_sectors']}\n"
+        for p in partitions
+    ))
 
     if offsets:
         for i in range(min(len(offsets), len(partitions))):
             p = partitions[i]
             offset = offsets[i]
-            print_partition_boot_record(file_path, p['start_lba'], offset, p['number'], verbose=verbose)
+            print_partition_boot_record(image, p['start_lba'], offset, p['number'], verbose=verbose)
 
 # Prints the 16-byte boot record from a given partition.
-def print_partition_boot_record(file_path, start_lba, offset, partition_number, verbose=False):
+def print_partition_boot_record(image, start_lba, offset, partition_number, verbose=False):
     sector_size = 512
     if verbose:
         print(f"{BOLD}{UNDERLINE}Reading boot record from partition {partition_number} at offset {offset}:{RESET}")
         print(f"Start LBA: {start_lba}, Calculated byte offset: {(start_lba * sector_size) + offset}")
-    with open(file_path, 'rb') as f:
-        seek_position = (start_lba * sector_size) + offset
-        f.seek(seek_position)
-        boot_record = f.read(16)
-        if len(boot_record) < 16:
-            print(f"{RED}Could not read 16 bytes from offset {offset} in partition {partition_number}.{RESET}")
-            return
+    seek_position = (start_lba * sector_size) + offset
+    boot_record = image[seek_position:seek_position + 16] if seek_position >= 0 else b''
+    if len(boot_record) < 16:
+        print(f"{RED}Could not read 16 bytes from offset {offset} in partition {partition_number}.{RESET}")
+        return
 
-    hex_values = ' '.join(f"{byte:02X}" for byte in boot_record)
-    ascii_values = ''.join(chr(byte) if 32 <= byte <= 126 else '.' for byte in boot_record)
+    hex_values = boot_record.hex(' ').upper()
+    ascii_values = boot_record.translate(PRINTABLE_ASCII).decode('ascii')
 
-    print(f"\nPartition number: {partition_number}")
-    print(f"16 bytes of boot record from offset {offset}: {hex_values}")
-    print(f"ASCII:                                    {'  '.join(ascii_values)}")
+    sys.stdout.write(f"\nPartition number: {partition_number}\n"
+                     f"16 bytes of boot record from offset {offset}: {hex_values}\n"
+                     f"ASCII:                                    {'  '.join(ascii_values)}\n")
 
 # Main function to parse arguments and determine the partition scheme.
 # This function was updated with assistance from ChatGPT, an AI tool developed by OpenAI.
@@ -304,20 +381,22 @@ def main():
 
     total_start_time = time.time()
 
-    calculate_hashes(args.file, verbose=verbose)
-    partition_types = load_partition_types()
+    # A single mapping serves hashing, scheme detection, the partition tables and the boot records
+    with map_image(args.file) as image:
+        calculate_hashes(image, args.file, verbose=verbose)
+        partition_types = load_partition_types()
 
-    scheme = detect_partition_scheme(args.file, verbose=verbose)
+        scheme, sector = detect_partition_scheme(image, args.file, verbose=verbose)
 
-    if scheme == 'MBR':
-        if not args.offset:
-            print("Offsets are required for MBR partitions.")
-            return
-        read_mbr(args.file, args.offset, partition_types, verbose=verbose)
-    elif scheme == 'GPT':
-        read_gpt(args.file, verbose=verbose)
-    else:
-        print("Unknown partitioning scheme.")
+        if scheme == 'MBR':
+            if not args.offset:
+                print("Offsets are required for MBR partitions.")
+                return
+            read_mbr(image, args.file, sector, args.offset, partition_types, verbose=verbose)
+        elif scheme == 'GPT':
+            read_gpt(image, args.file, sector, verbose=verbose)
+        else:
+            print("Unknown partitioning scheme.")
 
     total_end_time = time.time()
     if verbose: